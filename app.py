@@ -9,6 +9,7 @@
 
 
 import os
+import sys
 import json
 import subprocess
 import tarfile
@@ -49,33 +50,58 @@ esco_collection = Chroma(
 class GradioOutputManager:
     """Manages Gradio outputs by name instead of index to prevent order-related bugs."""
     
+    __slots__ = ('output_names', 'output_map', '_values')
+    
     def __init__(self, output_names):
         """Initialize with a list of output component names in the expected order."""
-        self.output_names = output_names
-        self.output_map = {name: idx for idx, name in enumerate(output_names)}
-        self._values = [None] * len(output_names)
+        # Interned names let set() lookups with literal names match by identity
+        self.output_names = tuple(sys.intern(name) for name in output_names)
+        self.output_map = {name: idx for idx, name in enumerate(self.output_names)}
+        self._values = [None] * len(self.output_names)
     
     def set(self, name, value):
         """Set a value for a named output."""
-        if name not in self.output_map:
-            raise ValueError(f"Unknown output name: {name}. Available: {list(self.output_map.keys())}")
-        self._values[self.output_map[name]] = value
+        try:
+            self._values[self.output_map[name]] = value
+        except KeyError:
+            raise ValueError(f"Unknown output name: {name}. Available: {list(self.output_map.keys())}") from None
         return self
     
     def set_multiple(self, **kwargs):
         """Set multiple outputs at once."""
+        output_map = self.output_map
+        values = self._values
         for name, value in kwargs.items():
-            self.set(name, value)
+            idx = output_map.get(name)
+            if idx is None:
+                raise ValueError(f"Unknown output name: {name}. Available: {list(output_map.keys())}")
+            values[idx] = value
         return self
     
     def get_tuple(self):
         """Return the values as a tuple in the correct order."""
         return tuple(self._values)
     
+    def get_list(self):
+        """Return the live values list in the correct order; callers must not mutate it."""
+        return self._values
+    
     def reset(self):
         """Reset all values to None."""
-        self._values = [None] * len(self.output_names)
+        # Cleared in place so repeated resets reuse the same list
+        values = self._values
+        for idx in range(len(values)):
+            values[idx] = None
         return self
+    
+    @classmethod
+    def for_feedback(cls):
+        """Create a manager for FEEDBACK_OUTPUTS from the layout precomputed at import."""
+        manager = cls.__new__(cls)
+        manager.output_names = FEEDBACK_OUTPUT_NAMES
+        manager.output_map = FEEDBACK_OUTPUT_MAP  # Shared, only ever read
+        manager._values = list(FEEDBACK_BLANK_VALUES)
+        return manager
 
 # Define output schemas for different functions
 FEEDBACK_OUTPUTS = [
@@ -93,6 +119,11 @@ FEEDBACK_OUTPUTS = [
     "memory_display"       # 11
 ]
 
+# Feedback layout built once, so per-event managers skip the setup
+FEEDBACK_OUTPUT_NAMES = tuple(sys.intern(name) for name in FEEDBACK_OUTPUTS)
+FEEDBACK_OUTPUT_MAP = {name: idx for idx, name in enumerate(FEEDBACK_OUTPUT_NAMES)}
+FEEDBACK_BLANK_VALUES = (None,) * len(FEEDBACK_OUTPUT_NAMES)
+
 SEE_RECOMMENDATIONS_OUTPUTS = [
     "profile_section",      # 0
     "recommend_section",    # 1
@@ -333,7 +364,7 @@ def chat_response(message, history):
 
 # ----------------- UI: Step 1 - Profile Creation -----------------
 from coachable_course_agent.linkedin_tools import build_profile_from_bio
-from coachable_course_agent.memory_store import load_user_profile
+from coachable_course_agent.memory_store import load_user_profile, update_user_profile
 from coachable_course_agent.vector_store import query_similar_courses
 
 from coachable_course_agent.justifier_chain import justify_recommendations
@@ -597,7 +628,7 @@ with gr.Blocks(title="Coachable Course Agent") as demo:
     )
 
     def feedback_action(feedback_type, recs, idx, feedback_log, user_id_state, agent_memory, chatbox):
-        outputs = GradioOutputManager(FEEDBACK_OUTPUTS)
+        outputs = GradioOutputManager.for_feedback()
         
         # Get current course
         if idx >= len(recs):
@@ -721,7 +752,7 @@ with gr.Blocks(title="Coachable Course Agent") as demo:
             ).get_tuple()
 
     def reason_action(reason, recs, idx, feedback_log, user_id_state, agent_memory, chatbox):
-        outputs = GradioOutputManager(FEEDBACK_OUTPUTS)
+        outputs = GradioOutputManager.for_feedback()
         
         # Get current course
         if idx >= len(recs):
@@ -910,8 +941,7 @@ with gr.Blocks(title="Coachable Course Agent") as demo:
             if isinstance(data, dict):
                 data["company_goal"] = company_goal
                 # Save updated profile with company goal
-                with open(f"{MEMORY_DIR}/{uid}.json", "w") as f:
-                    json.dump(data, f, indent=2)
+                update_user_profile(uid, data)
             
             # Create a clean, user-friendly success message
             headline = data.get("headline", "N/A") if isinstance(data, dict) else "N/A"
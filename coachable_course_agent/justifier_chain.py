@@ -5,13 +5,16 @@ from langchain_groq import ChatGroq
 from langchain.output_parsers import JsonOutputKeyToolsParser
 
 from dotenv import load_dotenv
+from functools import cache
 import os
 
 from coachable_course_agent.recommendation_prompt import base_prompt
 
 load_dotenv()
 
+@cache
 def create_justifier_chain():
+    # The chain holds no per-call state, so one LLM client and parsed prompt are reused
     llm = ChatGroq(model="llama-3.3-70b-versatile", temperature=0.3, api_key=os.getenv("GROQ_API_KEY"))
     prompt = PromptTemplate.from_template(base_prompt)
     return LLMChain(prompt=prompt, llm=llm)
@@ -7,7 +7,7 @@ from coachable_course_agent.esco_matcher import match_to_esco
 from coachable_course_agent.utils import extract_json_block
 
 from dotenv import load_dotenv
-from functools import partial
+from functools import partial, cache
 
 import os
 import json
@@ -15,17 +15,23 @@ import json
 load_dotenv()
 
 
+@cache
+def _esco_vectorstore():
+    """Load the ESCO skill vectorstore once and share it across profile builds."""
+    embedding_model = HuggingFaceEmbeddings(model_name="all-MiniLM-L6-v2")
+    return Chroma(
+        persist_directory="data/esco_chroma",
+        embedding_function=embedding_model
+    )
+
+
 def build_profile_from_bio(user_id, blurb):
     """
     Build a user profile from a LinkedIn-style bio and user ID.
     Returns the generated profile text and the loaded profile data (dict).
     """
     # Step 0: Load ChromaDB skill vectorstore
-    embedding_model = HuggingFaceEmbeddings(model_name="all-MiniLM-L6-v2")
-    vectorstore = Chroma(
-        persist_directory="data/esco_chroma",
-        embedding_function=embedding_model
-    )
+    vectorstore = _esco_vectorstore()
     # Step 1: Format prompt
     prompt = f"My user ID is {user_id}. Here is my bio: {blurb}"
     # Step 2: Create and run the agent (define tools inline to avoid circular import)
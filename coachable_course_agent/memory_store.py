@@ -1,6 +1,7 @@
 
 import os
 import json
+import orjson
 from datetime import datetime, timezone
 
 PROFILE_DIR = "data/memory"
@@ -10,11 +11,29 @@ os.makedirs(PROFILE_DIR, exist_ok=True)
 def _profile_path(user_id):
     return os.path.join(PROFILE_DIR, f"{user_id}.json")
 
+# Raw profile bytes per path, tagged with the (mtime_ns, size) they were read at
+_profile_bytes_cache = {}
+
+def _read_profile_bytes(path, stat):
+    signature = (stat.st_mtime_ns, stat.st_size)
+    cached = _profile_bytes_cache.get(path)
+    if cached is not None and cached[0] == signature:
+        return cached[1]
+    # Profiles are a few KB, so a plain read beats setting up an mmap
+    with open(path, 'rb') as f:
+        data = f.read()
+    _profile_bytes_cache[path] = (signature, data)
+    return data
+
 def load_user_profile(user_id):
     path = _profile_path(user_id)
-    if os.path.exists(path):
-        with open(path, 'r') as f:
-            return json.load(f)
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        stat = None
+    if stat is not None:
+        # Raw bytes are cached rather than the dict, since callers mutate the profile
+        return orjson.loads(_read_profile_bytes(path, stat))
     else:
         return {
             "user_id": user_id,
@@ -35,6 +54,8 @@ def update_user_profile(user_id, profile):
     path = _profile_path(user_id)
     with open(path, 'w') as f:
         json.dump(profile, f, indent=2)
+    # Don't trust mtime alone: a rewrite within the clock's resolution can keep it
+    _profile_bytes_cache.pop(path, None)
 
 def log_feedback(user_id, course_id, feedback_type, reason):
     profile = load_user_profile(user_id)
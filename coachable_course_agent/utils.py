@@ -1,5 +1,13 @@
 import json
 import re
+from functools import lru_cache
+
+# Provider name suffix cleanup patterns, compiled once at import
+PROVIDER_SUFFIX_RES = (
+    re.compile(r'\s+(Introduction To|Skills|Fundamentals|Certificate|Course|Program).*$', re.IGNORECASE),
+    re.compile(r'\s+(And|The|Of|For|In|With|To|From)$', re.IGNORECASE),  # Trailing prepositions
+    re.compile(r'\s+[A-Z]$', re.IGNORECASE)  # Single trailing letters
+)
 
 def extract_json_block(text: str) -> dict:
     try:
@@ -12,21 +20,45 @@ def extract_json_block(text: str) -> dict:
             return json.loads(match.group(1))
         raise
 
+def _is_capital(char):
+    return 'A' <= char <= 'Z'
+
+def _strip_leading_initial(name):
+    """Remove a doubled or stray capital initial from the start of a provider name."""
+    # Fix the double letter issue at the beginning: if first two letters are same uppercase, remove first
+    # e.g., "UUniversity" → "University", "IIBM" → "IBM", "OO.P." → "O.P."
+    if len(name) > 1 and _is_capital(name[0]) and name[1] == name[0]:
+        name = name[1:]
+    
+    if not name or not _is_capital(name[0]):
+        return name
+    
+    # Skip the whitespace after a leading capital; a capital must follow it
+    end = 1
+    while end < len(name) and name[end].isspace():
+        end += 1
+    if end == 1 or end == len(name) or not _is_capital(name[end]):
+        return name
+    
+    # Fix the double letter issue: single letter, space, then same letter followed by word
+    # e.g., "D DUke" → "Uke"
+    if (name[end] == name[0] and end + 2 < len(name)
+            and _is_capital(name[end + 1]) and 'a' <= name[end + 2] <= 'z'):
+        return name[end + 1:]
+    
+    # Otherwise drop the stray letter, e.g. "D Duke" → "Duke"
+    return name[end:]
+
+@lru_cache(maxsize=4096)
 def clean_provider_name(provider):
     """Clean provider name by removing duplicate letters and formatting properly"""
+    # Cached because the same few providers repeat across thousands of courses
     if not provider:
         return ""
     
-    # Fix the double letter issue at the beginning: if first two letters are same uppercase, remove first
-    # e.g., "UUniversity" → "University", "IIBM" → "IBM", "OO.P." → "O.P."
-    cleaned = re.sub(r'^([A-Z])\1', r'\1', provider)
-    
-    # Fix the double letter issue (e.g., "D Duke University" → "Duke University")
-    # Pattern: single letter, space, then same letter followed by word
-    cleaned = re.sub(r'^([A-Z])\s+\1([A-Z][a-z])', r'\2', cleaned)
-    
-    # Additional cleanup patterns
-    cleaned = re.sub(r'^([A-Z])\s+([A-Z])', r'\2', cleaned)  # "D Duke" → "Duke"
+    # Fix doubled or stray leading initials with plain character checks
+    # (e.g., "UUniversity" → "University", "D Duke University" → "Duke University")
+    cleaned = _strip_leading_initial(provider)
     
     # Remove duplicate words (e.g., "Arizona State University Arizona State" → "Arizona State University")
     words = cleaned.split()
@@ -50,17 +82,15 @@ def clean_provider_name(provider):
     
     # Clean up specific patterns that often appear
     # Remove course-specific suffixes that got mixed into provider names
-    course_suffixes = [
-        r'\s+(Introduction To|Skills|Fundamentals|Certificate|Course|Program).*$',
-        r'\s+(And|The|Of|For|In|With|To|From)$',  # Trailing prepositions
-        r'\s+[A-Z]$'  # Single trailing letters
-    ]
-    
-    for pattern in course_suffixes:
-        cleaned = re.sub(pattern, '', cleaned, flags=re.IGNORECASE)
+    for pattern in PROVIDER_SUFFIX_RES:
+        cleaned = pattern.sub('', cleaned)
     
     return cleaned.strip()
 
+def clean_provider_names_batch(providers):
+    """Clean a batch of provider names; repeated names come from the cache"""
+    return [clean_provider_name(provider) for provider in providers]
+
 def calculate_confidence_scores(scores):
     """
     Convert distance scores to normalized confidence scores (0-1 range).
@@ -27,7 +27,7 @@ from langchain.vectorstores import Chroma
 from langchain.embeddings import HuggingFaceEmbeddings
 
 from coachable_course_agent.esco_matcher import match_to_esco
-from coachable_course_agent.utils import clean_provider_name
+from coachable_course_agent.utils import clean_provider_name, clean_provider_names_batch
 
 
 class CourseConsolidator:
@@ -170,7 +170,7 @@ class CourseConsolidator:
                 semantic_removed += len(course_group) - 1
                 
                 # Log semantic duplicates being removed
-                providers = [clean_provider_name(c.get('provider', '')) for c in course_group]
+                providers = clean_provider_names_batch(c.get('provider', '') for c in course_group)
                 print(f"   🎯 Merged {len(course_group)} semantic duplicates: '{course_group[0].get('title', '')}' from {', '.join(providers[:3])}")
                 
         print(f"   Removed {semantic_removed} semantic duplicates")
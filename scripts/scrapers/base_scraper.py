@@ -3,24 +3,94 @@ Base scraper interface for course platforms
 """
 
 from abc import ABC, abstractmethod
-from typing import List, Dict
+from dataclasses import asdict
+from typing import List, Dict, Iterator
 import time
 import random
 import uuid
 import sys
 import os
-from datetime import datetime
+import threading
+from datetime import datetime, timedelta
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 # Add parent directory to path to import utils
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
 from coachable_course_agent.utils import clean_provider_name
 
+# On-disk HTTP cache for scrapers that opt in via `cache_name`
+HTTP_CACHE_DIR = "data/scraped_courses/http_cache"
+
+class Course:
+    """
+    Base for the course records scrapers keep as slotted objects until serialized
+    
+    Each platform declares its record as a @dataclass(slots=True) subclass, with the
+    fields in the key order of that platform's scraped JSON files.
+    """
+    __slots__ = ()
+    
+    def to_dict(self) -> Dict:
+        """Convert to the plain dictionary written to the scraped JSON files"""
+        return asdict(self)
+
 
 class BaseScraper(ABC):
     """Abstract base class for all course scrapers"""
     
+    # Set in subclasses to cache GET responses on disk between runs
+    cache_name = None
+    cache_expire_after = timedelta(days=7)
+    
     def __init__(self):
         self.delay_range = (1, 3)  # Random delay between requests (seconds)
+        self.session = self._create_session()
+        
+        # Shared by worker threads so concurrent fetches still respect delay_range
+        self._request_slot_lock = threading.Lock()
+        self._next_request_at = 0.0
+    
+    def _create_session(self) -> requests.Session:
+        """Create a pooled HTTP session so requests to the same host reuse connections"""
+        # Scrapers must not override Accept-Encoding: requests asks for gzip/deflate and
+        # adds br only when brotli is installed, so we never advertise an encoding
+        # urllib3 cannot decode
+        if self.cache_name:
+            # Only scrapers that cache need the optional requests-cache dependency
+            import requests_cache
+            
+            os.makedirs(HTTP_CACHE_DIR, exist_ok=True)
+            session = requests_cache.CachedSession(
+                os.path.join(HTTP_CACHE_DIR, self.cache_name),
+                backend='sqlite',
+                expire_after=self.cache_expire_after,
+                allowable_methods=('GET',)
+            )
+        else:
+            session = requests.Session()
+        
+        adapter = HTTPAdapter(
+            pool_connections=8,
+            pool_maxsize=16,
+            max_retries=self._retry_policy()
+        )
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        return session
+    
+    def _retry_policy(self) -> Retry:
+        """Retry connection errors and throttled/transient server responses with backoff"""
+        # After the last retry the response is returned as-is, so callers still see
+        # the failing status code instead of a RetryError
+        return Retry(
+            total=3,
+            backoff_factor=0.5,
+            status_forcelist=(429, 500, 502, 503, 504),
+            raise_on_status=False
+        )
     
     @abstractmethod
     def search_courses(self, topic: str, count: int) -> List[Dict]:
@@ -36,6 +106,15 @@ class BaseScraper(ABC):
         """
         pass
     
+    def iter_courses(self, topic: str, count: int) -> Iterator[Dict]:
+        """
+        Yield courses one at a time as they are scraped
+        
+        Scrapers that can stream results override this and make search_courses
+        a thin list() wrapper; by default it just walks search_courses.
+        """
+        yield from self.search_courses(topic, count)
+    
     @abstractmethod
     def extract_course_data(self, course_element) -> Dict:
         """
@@ -49,11 +128,46 @@ class BaseScraper(ABC):
         """
         pass
     
+    def course_id_for_url(self, url: str) -> str:
+        """
+        Derive a stable course ID from the course URL
+        
+        The same course scraped twice gets the same ID, so downstream steps can
+        dedupe on it. Falls back to a random UUID when the URL is unknown.
+        """
+        if not url:
+            return str(uuid.uuid4())
+        return str(uuid.uuid5(uuid.NAMESPACE_URL, url))
+    
+    def declared_encoding(self, response: requests.Response) -> str:
+        """
+        Return the charset declared in the Content-Type header, defaulting to UTF-8
+        
+        requests assumes ISO-8859-1 for text/* responses without a charset, and
+        lxml's feed parsers fall back to Latin-1 when given no encoding; both would
+        mis-decode the UTF-8 pages these platforms serve.
+        """
+        if 'charset' in response.headers.get('Content-Type', '').lower():
+            return response.encoding
+        return 'utf-8'
+    
     def sleep_between_requests(self):
         """Add random delay to avoid rate limiting"""
         delay = random.uniform(*self.delay_range)
         time.sleep(delay)
     
+    def wait_for_request_slot(self):
+        """Block until this scraper may start another request, across all threads
+        
+        Request starts are spaced by a random delay from delay_range, so a pool of
+        workers sends no more requests than a single sequential loop would.
+        """
+        with self._request_slot_lock:
+            now = time.monotonic()
+            start_at = max(now, self._next_request_at)
+            self._next_request_at = start_at + random.uniform(*self.delay_range)
+        time.sleep(start_at - now)
+    
     def standardize_course_data(self, raw_data: Dict) -> Dict:
         """
         Standardize course data to common format
@@ -68,7 +182,7 @@ class BaseScraper(ABC):
         provider = clean_provider_name(raw_data.get('provider', ''))
         
         return {
-            'id': str(uuid.uuid4()),  # Generate unique ID for each course
+            'id': self.course_id_for_url(raw_data.get('url', '')),
             'title': raw_data.get('title', ''),
             'provider': provider,  # Use cleaned provider name
             'url': raw_data.get('url', ''),
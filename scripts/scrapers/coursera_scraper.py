@@ -2,7 +2,6 @@
 Coursera scraper implementation
 """
 
-import requests
 from bs4 import BeautifulSoup
 from typing import List, Dict
 import re
@@ -20,6 +19,7 @@ class CourseraScraper(BaseScraper):
         self.headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
         }
+        self.session.headers.update(self.headers)
     
     def search_courses(self, topic: str, count: int) -> List[Dict]:
         """Search for courses on Coursera"""
@@ -34,7 +34,7 @@ class CourseraScraper(BaseScraper):
             }
             
             print(f"  Searching Coursera for '{topic}'...")
-            response = requests.get(self.search_url, params=params, headers=self.headers)
+            response = self.session.get(self.search_url, params=params, timeout=30)
             response.raise_for_status()
             
             soup = BeautifulSoup(response.content, 'html.parser')
@@ -297,7 +297,7 @@ class CourseraScraper(BaseScraper):
         """
         try:
             print(f"    Fetching details from: {course_url}")
-            response = requests.get(course_url, headers=self.headers, timeout=10)
+            response = self.session.get(course_url, timeout=10)
             response.raise_for_status()
             
             soup = BeautifulSoup(response.content, 'html.parser')
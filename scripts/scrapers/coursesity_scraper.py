@@ -2,12 +2,13 @@
 Coursesity scraper implementation - Course aggregator platform
 """
 
-import requests
 from bs4 import BeautifulSoup
+from lxml import etree
 from typing import List, Dict
 import time
 import random
 import re
+import json
 from urllib.parse import urljoin, quote_plus
 from .base_scraper import BaseScraper
 
@@ -24,15 +25,13 @@ class CoursesityScraper(BaseScraper):
             'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,image/apng,*/*;q=0.8',
             'Accept-Language': 'en-US,en;q=0.9',
-            'Accept-Encoding': 'gzip, deflate, br',
             'DNT': '1',
             'Connection': 'keep-alive',
             'Upgrade-Insecure-Requests': '1',
             'Cache-Control': 'max-age=0'
         }
         
-        # Initialize session for better state management
-        self.session = requests.Session()
+        # Send the browser headers with every request made through the shared session
         self.session.headers.update(self.headers)
         self.delay_range = (2, 4)  # Moderate delays
     
@@ -56,12 +55,12 @@ class CoursesityScraper(BaseScraper):
                     response = self.session.get(
                         search_url,
                         timeout=(10, 30),
-                        allow_redirects=True
+                        allow_redirects=True,
+                        stream=True
                     )
                     
                     if response.status_code == 200:
-                        soup = BeautifulSoup(response.content, 'html.parser')
-                        page_courses = self._extract_courses_from_page(soup, topic, count - len(courses))
+                        page_courses = self._extract_courses_from_response(response, topic, count - len(courses))
                         courses.extend(page_courses)
                         
                         if len(courses) >= count:
@@ -70,6 +69,7 @@ class CoursesityScraper(BaseScraper):
                         # Small delay between pages
                         time.sleep(random.uniform(1, 2))
                     else:
+                        response.close()
                         print(f"      Status code: {response.status_code}")
                         
                 except Exception as e:
@@ -126,6 +126,53 @@ class CoursesityScraper(BaseScraper):
         
         return urls
     
+    def _extract_courses_from_response(self, response, topic: str, max_courses: int) -> List[Dict]:
+        """
+        Stream a Coursesity page through lxml's incremental parser.
+        
+        The course list is embedded as JSON in <script id="app-root-state">, so we
+        stop downloading as soon as that tag has been received. The full page is
+        only parsed with BeautifulSoup when the JSON state is missing or invalid.
+        """
+        parser = etree.HTMLPullParser(
+            events=('end',), tag='script', encoding=self.declared_encoding(response)
+        )
+        chunks = []
+        
+        try:
+            for chunk in response.iter_content(chunk_size=8192):
+                chunks.append(chunk)
+                parser.feed(chunk)
+                
+                for _, element in parser.read_events():
+                    if element.get('id') != 'app-root-state':
+                        continue
+                    try:
+                        data = json.loads(element.text or '')
+                    except ValueError:
+                        break  # Let the full-page fallback report the error
+                    return self._extract_courses_from_state(data, topic, max_courses)
+        finally:
+            response.close()
+        
+        soup = BeautifulSoup(b''.join(chunks), 'lxml')
+        return self._extract_courses_from_page(soup, topic, max_courses)
+    
+    def _extract_courses_from_state(self, data: Dict, topic: str, max_courses: int) -> List[Dict]:
+        """Extract course information from the page's embedded JSON state"""
+        courses = []
+        
+        course_list = data.get('COURSE_LIST', {}).get('courseData', [])
+        print(f"    Found {len(course_list)} courses in JSON data")
+        
+        for course_json in course_list[:max_courses]:
+            course_data = self._extract_course_from_json(course_json, topic)
+            if course_data:
+                courses.append(course_data)
+                print(f"      Extracted: {course_data.get('title', 'No title')}")
+        
+        return courses
+    
     def _extract_courses_from_page(self, soup: BeautifulSoup, topic: str, max_courses: int) -> List[Dict]:
         """Extract course information from a Coursesity page"""
         courses = []
@@ -135,21 +182,11 @@ class CoursesityScraper(BaseScraper):
         
         if script_tags:
             try:
-                import json
                 json_text = script_tags[0].get_text()
                 data = json.loads(json_text)
                 
                 # Extract course data from JSON
-                course_list = data.get('COURSE_LIST', {}).get('courseData', [])
-                print(f"    Found {len(course_list)} courses in JSON data")
-                
-                for course_json in course_list[:max_courses]:
-                    course_data = self._extract_course_from_json(course_json, topic)
-                    if course_data:
-                        courses.append(course_data)
-                        print(f"      Extracted: {course_data.get('title', 'No title')}")
-                
-                return courses
+                return self._extract_courses_from_state(data, topic, max_courses)
                 
             except Exception as e:
                 print(f"    Error parsing JSON data: {e}")
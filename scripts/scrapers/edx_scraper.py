@@ -2,7 +2,6 @@
 edX scraper implementation
 """
 
-import requests
 from bs4 import BeautifulSoup
 from typing import List, Dict
 from .base_scraper import BaseScraper
@@ -18,6 +17,7 @@ class EdxScraper(BaseScraper):
         self.headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
         }
+        self.session.headers.update(self.headers)
     
     def search_courses(self, topic: str, count: int) -> List[Dict]:
         """Search for courses on edX"""
@@ -30,7 +30,7 @@ class EdxScraper(BaseScraper):
             }
             
             print(f"  Searching edX for '{topic}'...")
-            response = requests.get(self.search_url, params=params, headers=self.headers)
+            response = self.session.get(self.search_url, params=params, timeout=30)
             response.raise_for_status()
             
             soup = BeautifulSoup(response.content, 'html.parser')
@@ -51,8 +51,6 @@ class EdxScraper(BaseScraper):
                 except Exception as e:
                     print(f"    Warning: Failed to extract course data: {e}")
                     continue
-                
-                self.sleep_between_requests()
             
         except Exception as e:
             print(f"    Error searching edX: {e}")
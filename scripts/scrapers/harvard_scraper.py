@@ -3,22 +3,86 @@ Harvard Online Learning Scraper
 Scrapes course data from Harvard's Professional and Lifelong Learning platform
 """
 
-import requests
-from bs4 import BeautifulSoup
-import time
-import random
-import uuid
+from bs4 import BeautifulSoup, SoupStrainer
 from urllib.parse import urljoin, urlparse
 import json
 import re
-from typing import List, Dict
+import random
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import timedelta
+from typing import List, Dict, Iterator
+
+from .base_scraper import BaseScraper, Course
+
+COURSE_HREF_RE = re.compile(r'/course/')
+HEADER_PREFIX_RE = re.compile(r'^###\s*')
+WEEKS_RE = re.compile(r'(\d+)\s*WEEKS?', re.IGNORECASE)
+LEVEL_RE = re.compile(r'(?P<beginner>introduction|intro|beginner|basics)|(?P<advanced>advanced|expert|master)', re.IGNORECASE)
 
-from .base_scraper import BaseScraper
+# Labelled card fields, matched against the card's newline-joined text. A label
+# and its value are usually separate elements, so the value's line is included.
+PRICE_LINE_RE = re.compile(r'PRICE.*(?:\n.*)?')
+DURATION_LINE_RE = re.compile(r'DURATION.*(?:\n.*)?')
+SUBJECT_LINE_RE = re.compile(r'^.*(?:COMPUTER SCIENCE|PROGRAMMING|HEALTH|MEDICINE|HUMANITIES|SOCIAL SCIENCES).*$', re.MULTILINE)
+
+# Common skills for Harvard courses
+SKILL_KEYWORDS = (
+    'programming', 'computer science', 'python', 'javascript', 'web development',
+    'data science', 'statistics', 'machine learning', 'artificial intelligence',
+    'business', 'management', 'leadership', 'finance', 'economics',
+    'marketing', 'strategy', 'health', 'medicine', 'psychology',
+    'philosophy', 'ethics', 'law', 'writing', 'communication',
+    'project management', 'research', 'analysis'
+)
+
+# Single scan over the text; longer keywords win, so 'project management' is not
+# also reported as 'management'.
+SKILL_RE = re.compile(
+    r'(?<!\w)(?:' + '|'.join(re.escape(skill) for skill in sorted(SKILL_KEYWORDS, key=len, reverse=True)) + ')',
+    re.IGNORECASE
+)
+
+# Only build the parts of a catalog page that hold course cards
+COURSE_CARD_STRAINER = SoupStrainer('div', class_='course-card')
+
+
+@dataclass(slots=True)
+class HarvardCourse(Course):
+    """A scraped Harvard PLL course"""
+    id: str
+    title: str
+    provider: str
+    url: str
+    description: str
+    duration_hours: int
+    level: str
+    format: str
+    skills: List[str]
+    subject: str
+    rating: float
+    enrollment_count: int
+    price: str
+    source_platform: str
+    # Lowercased title/description/skills for relevance checks, never serialized
+    search_blob: str = field(default='', repr=False, compare=False)
+    
+    def to_dict(self) -> Dict:
+        """Convert to the plain dictionary written to the scraped JSON files"""
+        # Course.to_dict named explicitly: zero-argument super() breaks in slotted dataclasses
+        data = Course.to_dict(self)
+        del data['search_blob']
+        return data
 
 
 class HarvardScraper(BaseScraper):
     """Scraper for Harvard Professional and Lifelong Learning"""
     
+    # Catalog search results change more often than course pages
+    cache_name = "harvard_pll"
+    cache_expire_after = timedelta(days=1)
+    
     def __init__(self):
         super().__init__()
         self.base_url = "https://pll.harvard.edu"
@@ -26,29 +90,46 @@ class HarvardScraper(BaseScraper):
         
     def search_courses(self, topic: str, count: int) -> List[Dict]:
         """Search for courses on Harvard PLL"""
-        courses = []
+        return list(self.iter_courses(topic, count))
+    
+    def iter_courses(self, topic: str, count: int) -> Iterator[Dict]:
+        """Yield Harvard PLL courses as soon as each card is extracted"""
+        courses_found = 0
         
         print(f"🏫 Searching Harvard PLL for '{topic}'...")
         
+        # Lowercase and tokenize the topic once for all relevance checks
+        topic_lower = topic.lower()
+        topic_words = tuple(topic_lower.split())
+        
+        # Pages are fetched one ahead on a background thread, so the next request
+        # (and its politeness delay) overlaps with parsing the current page
+        prefetcher = ThreadPoolExecutor(max_workers=1)
+        # Set once we stop reading pages, so a queued prefetch never sends its request
+        stopped = threading.Event()
+        
         try:
             # Search through catalog pages
             page = 0
-            courses_found = 0
+            max_pages = 10
+            next_response = prefetcher.submit(self._fetch_catalog_page, topic, page, stopped, False)
             
-            while courses_found < count and page < 10:  # Limit to 10 pages
-                params = {
-                    'page': page,
-                    'search': topic
-                }
+            while courses_found < count and page < max_pages:
+                response = next_response.result()
                 
-                response = requests.get(self.catalog_url, params=params, timeout=30)
-                response.raise_for_status()
+                if page + 1 < max_pages:
+                    next_response = prefetcher.submit(self._fetch_catalog_page, topic, page + 1, stopped)
                 
-                soup = BeautifulSoup(response.content, 'html.parser')
+                # Find course cards, falling back to plain course links
+                soup = BeautifulSoup(response.content, 'lxml', parse_only=COURSE_CARD_STRAINER)
+                course_cards = soup.find_all('div', class_='course-card')
+                prefilter_cards = bool(topic_words and course_cards)
                 
-                # Find course cards
-                course_cards = soup.find_all('div', class_='course-card') or \
-                              soup.find_all('a', href=re.compile(r'/course/'))
+                if not course_cards:
+                    # Plain links need the whole page: their descriptions are read
+                    # from the elements that follow them
+                    soup = BeautifulSoup(response.content, 'lxml')
+                    course_cards = soup.find_all('a', href=COURSE_HREF_RE)
                 
                 if not course_cards:
                     print(f"   No more courses found on page {page}")
@@ -60,28 +141,67 @@ class HarvardScraper(BaseScraper):
                 for card in course_cards:
                     if courses_found >= count:
                         break
-                        
+                    
+                    # Cheap pre-filter, only for course-card divs holding their own <p>:
+                    # title, description and skills are then all read from inside the card,
+                    # so a card whose text has none of the topic words cannot pass
+                    # is_relevant_course. Plain links take their description from the
+                    # elements after them, so they always go through full extraction.
+                    if prefilter_cards and card.find('p') is not None:
+                        # Joined without separators, like the get_text(strip=True) calls
+                        # in extract_course_data, so their text is always a substring
+                        card_text = card.get_text(strip=True).lower()
+                        if not any(word in card_text for word in topic_words):
+                            continue
+                    
                     try:
                         course_data = self.extract_course_data(card)
-                        if course_data and self.is_relevant_course(course_data, topic):
-                            courses.append(course_data)
-                            courses_found += 1
-                            print(f"   ✅ Added: {course_data['title']}")
+                        if not (course_data and self.is_relevant_course(course_data, topic_lower, topic_words)):
+                            continue
                         
                     except Exception as e:
                         print(f"   ⚠️ Error extracting course: {e}")
                         continue
+                    
+                    courses_found += 1
+                    print(f"   ✅ Added: {course_data.title}")
+                    yield course_data.to_dict()
                 
                 page += 1
-                time.sleep(random.uniform(*self.delay_range))
                 
         except Exception as e:
             print(f"❌ Error searching Harvard PLL: {e}")
+        
+        finally:
+            # The prefetch has usually started already, so cancel_futures alone cannot
+            # stop it; the event makes it give up instead of requesting an unread page
+            stopped.set()
+            prefetcher.shutdown(wait=False, cancel_futures=True)
             
-        print(f"✅ Successfully scraped {len(courses)} courses from Harvard")
-        return courses
+        print(f"✅ Successfully scraped {courses_found} courses from Harvard")
+    
+    def _fetch_catalog_page(self, topic: str, page: int, stopped: threading.Event, delay: bool = True):
+        """
+        Fetch one catalog search page, waiting the politeness delay first
+        
+        Returns None without sending the request if `stopped` is set before the
+        delay is over.
+        """
+        if delay:
+            stopped.wait(random.uniform(*self.delay_range))
+        if stopped.is_set():
+            return None
+        
+        params = {
+            'page': page,
+            'search': topic
+        }
+        
+        response = self.session.get(self.catalog_url, params=params, timeout=30)
+        response.raise_for_status()
+        return response
     
-    def extract_course_data(self, course_element) -> Dict:
+    def extract_course_data(self, course_element) -> HarvardCourse:
         """Extract course data from a course card element"""
         
         # Extract title and URL
@@ -96,7 +216,7 @@ class HarvardScraper(BaseScraper):
                 url = urljoin(self.base_url, href)
         
         # Clean up title
-        title = re.sub(r'^###\\s*', '', title)  # Remove markdown headers
+        title = HEADER_PREFIX_RE.sub('', title)  # Remove markdown headers
         
         # Extract description
         description = ""
@@ -105,92 +225,80 @@ class HarvardScraper(BaseScraper):
         if desc_elem:
             description = desc_elem.get_text(strip=True)
         
+        # Flatten the card once; price, duration and subject are read from its lines
+        card_text = course_element.get_text('\n', strip=True)
+        
         # Extract price
-        price_text = ""
-        price_elem = course_element.find(string=re.compile(r'PRICE'))
-        if price_elem:
-            price_parent = price_elem.find_parent()
-            if price_parent:
-                price_text = price_parent.get_text(strip=True)
+        price_match = PRICE_LINE_RE.search(card_text)
+        price_text = price_match.group(0) if price_match else ""
         
         # Extract duration
-        duration_text = ""
         duration_hours = 0
-        duration_elem = course_element.find(string=re.compile(r'DURATION'))
-        if duration_elem:
-            duration_parent = duration_elem.find_parent()
-            if duration_parent:
-                duration_text = duration_parent.get_text(strip=True)
-                # Extract hours from duration
-                weeks_match = re.search(r'(\\d+)\\s*WEEKS?', duration_text, re.IGNORECASE)
-                if weeks_match:
-                    weeks = int(weeks_match.group(1))
-                    duration_hours = weeks * 10  # Estimate 10 hours per week
+        duration_match = DURATION_LINE_RE.search(card_text)
+        if duration_match:
+            # Extract hours from duration
+            weeks_match = WEEKS_RE.search(duration_match.group(0))
+            if weeks_match:
+                weeks = int(weeks_match.group(1))
+                duration_hours = weeks * 10  # Estimate 10 hours per week
         
         # Determine level
         level = "Intermediate"
-        title_lower = title.lower()
-        if any(word in title_lower for word in ['introduction', 'intro', 'beginner', 'basics']):
+        level_words = {match.lastgroup for match in LEVEL_RE.finditer(title)}
+        if 'beginner' in level_words:
             level = "Beginner"
-        elif any(word in title_lower for word in ['advanced', 'expert', 'master']):
+        elif 'advanced' in level_words:
             level = "Advanced"
         
         # Extract subject area
-        subject = ""
-        subject_elem = course_element.find('span', string=re.compile(r'COMPUTER SCIENCE|PROGRAMMING|HEALTH|MEDICINE|HUMANITIES|SOCIAL SCIENCES'))
-        if subject_elem:
-            subject = subject_elem.get_text(strip=True)
+        subject_match = SUBJECT_LINE_RE.search(card_text)
+        subject = subject_match.group(0) if subject_match else ""
         
         # Extract skills from title and description
-        skills = self.extract_skills_from_text(f"{title} {description}")
+        skills = self.extract_skills_from_text(title, description)
         
         # Determine if free or paid
-        is_free = "FREE" in price_text
-        
-        course_data = {
-            "id": str(uuid.uuid4()),
-            "title": title,
-            "provider": "Harvard University",
-            "url": url,
-            "description": description,
-            "duration_hours": duration_hours or 20,  # Default estimate
-            "level": level,
-            "format": "Online",
-            "skills": skills,
-            "subject": subject,
-            "rating": 4.7,  # Harvard is generally high quality
-            "enrollment_count": 0,  # Not available
-            "price": "Free" if is_free else "Paid",
-            "source_platform": "harvard_pll"
-        }
+        is_free = "FREE" in price_text.upper()
+        
+        course_data = HarvardCourse(
+            id=self.course_id_for_url(url),
+            title=title,
+            provider="Harvard University",
+            url=url,
+            description=description,
+            duration_hours=duration_hours or 20,  # Default estimate
+            level=level,
+            format="Online",
+            skills=skills,
+            subject=subject,
+            rating=4.7,  # Harvard is generally high quality
+            enrollment_count=0,  # Not available
+            price="Free" if is_free else "Paid",
+            source_platform="harvard_pll",
+            # Lowercased text searched by is_relevant_course, built once per course
+            search_blob=f"{title} {description} {' '.join(skills)}".lower()
+        )
         
         return course_data
     
-    def extract_skills_from_text(self, text: str) -> List[str]:
-        """Extract potential skills from course text"""
-        skills = []
-        text_lower = text.lower()
-        
-        # Common skills for Harvard courses
-        skill_keywords = [
-            'programming', 'computer science', 'python', 'javascript', 'web development',
-            'data science', 'statistics', 'machine learning', 'artificial intelligence',
-            'business', 'management', 'leadership', 'finance', 'economics',
-            'marketing', 'strategy', 'health', 'medicine', 'psychology',
-            'philosophy', 'ethics', 'law', 'writing', 'communication',
-            'project management', 'research', 'analysis'
-        ]
-        
-        for skill in skill_keywords:
-            if skill in text_lower:
-                skills.append(skill.title())
-        
-        return skills
+    def extract_skills_from_text(self, *texts: str) -> List[str]:
+        """Extract potential skills from one or more pieces of course text"""
+        # Each text is scanned as-is; only the few matched keywords get lowercased
+        found = {match.lower() for text in texts for match in SKILL_RE.findall(text)}
+        
+        # Keep the keyword order stable for the output
+        return [skill.title() for skill in SKILL_KEYWORDS if skill in found]
     
-    def is_relevant_course(self, course_data: Dict, topic: str) -> bool:
-        """Check if course is relevant to the search topic"""
-        topic_lower = topic.lower()
-        searchable_text = f"{course_data['title']} {course_data['description']} {' '.join(course_data['skills'])}".lower()
+    def is_relevant_course(self, course_data: HarvardCourse, topic_lower: str, topic_words: tuple) -> bool:
+        """
+        Check if course is relevant to the search topic
+        
+        Args:
+            course_data: Course from extract_course_data
+            topic_lower: Lowercased search topic
+            topic_words: Words of the lowercased topic, split once by the caller
+        """
+        searchable_text = course_data.search_blob
         
         # Simple relevance check
-        return topic_lower in searchable_text or any(word in searchable_text for word in topic_lower.split())
+        return topic_lower in searchable_text or any(word in searchable_text for word in topic_words)
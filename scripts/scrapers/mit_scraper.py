@@ -3,152 +3,244 @@ MIT OpenCourseWare Scraper
 Scrapes course data from MIT's OpenCourseWare platform
 """
 
-import requests
-from bs4 import BeautifulSoup
-import time
-import random
-import uuid
+from lxml import etree, html as lxml_html
 from urllib.parse import urljoin, urlparse
 import json
 import re
-from typing import List, Dict
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+from typing import List, Dict, Iterator, Optional
 
-from .base_scraper import BaseScraper
+from .base_scraper import BaseScraper, Course
+
+
+def _class_xpath(class_name: str) -> str:
+    """XPath for the first element carrying a CSS class (same matching as '.class_name')"""
+    return f"(//*[contains(concat(' ', normalize-space(@class), ' '), ' {class_name} ')])[1]"
+
+
+TITLE_SUFFIX_RE = re.compile(r'\s*\|\s*MIT OpenCourseWare')
+COURSE_PREFIX_RE = re.compile(r'^[\d\.]+\s*\|\s*')
+# Course slugs start with the department and subject number, e.g. "6-046j-..." for 6.046J
+COURSE_NUMBER_RE = re.compile(r'/courses/(\d+)-(\d+[a-z]*)-')
+DEPARTMENT_RE = re.compile(r'/courses/([^/]+)')
+
+# Course levels by department number
+UNDERGRADUATE_DEPARTMENTS = frozenset({'1', '2', '3'})
+ADVANCED_DEPARTMENTS = frozenset({'6', '15', '18'})
+
+# Common technical skills
+SKILL_KEYWORDS = (
+    'python', 'java', 'javascript', 'c++', 'c programming', 'sql',
+    'machine learning', 'artificial intelligence', 'data analysis',
+    'statistics', 'calculus', 'linear algebra', 'probability',
+    'algorithms', 'programming', 'software engineering',
+    'computer science', 'mathematics', 'physics', 'chemistry',
+    'biology', 'economics', 'finance', 'management'
+)
+
+# Longest keyword first and anchored at a word start: 'javascript' no longer also
+# yields 'java', nor 'basic programming' 'c programming'.
+SKILL_RE = re.compile(
+    r'(?<!\w)(?:' + '|'.join(re.escape(skill) for skill in sorted(SKILL_KEYWORDS, key=len, reverse=True)) + ')',
+    re.IGNORECASE
+)
+
+# Popular MIT OCW courses organized by topic
+MIT_COURSES = {
+    'computer science': [
+        'https://ocw.mit.edu/courses/6-0001-introduction-to-computer-science-and-programming-in-python-fall-2016/',
+        'https://ocw.mit.edu/courses/6-006-introduction-to-algorithms-fall-2011/',
+        'https://ocw.mit.edu/courses/6-046j-design-and-analysis-of-algorithms-spring-2015/',
+        'https://ocw.mit.edu/courses/6-034-artificial-intelligence-fall-2010/',
+        'https://ocw.mit.edu/courses/6-00sc-introduction-to-computer-science-and-programming-spring-2011/'
+    ],
+    'programming': [
+        'https://ocw.mit.edu/courses/6-0001-introduction-to-computer-science-and-programming-in-python-fall-2016/',
+        'https://ocw.mit.edu/courses/6-00sc-introduction-to-computer-science-and-programming-spring-2011/',
+        'https://ocw.mit.edu/courses/6-189-a-gentle-introduction-to-programming-using-python-january-iap-2011/'
+    ],
+    'machine learning': [
+        'https://ocw.mit.edu/courses/6-034-artificial-intelligence-fall-2010/',
+        'https://ocw.mit.edu/courses/6-867-machine-learning-fall-2006/',
+        'https://ocw.mit.edu/courses/9-520-statistical-learning-theory-and-applications-spring-2003/'
+    ],
+    'artificial intelligence': [
+        'https://ocw.mit.edu/courses/6-034-artificial-intelligence-fall-2010/',
+        'https://ocw.mit.edu/courses/6-825-techniques-in-artificial-intelligence-sma-5504-fall-2002/'
+    ],
+    'mathematics': [
+        'https://ocw.mit.edu/courses/18-01sc-single-variable-calculus-fall-2010/',
+        'https://ocw.mit.edu/courses/18-02sc-multivariable-calculus-fall-2010/',
+        'https://ocw.mit.edu/courses/18-06-linear-algebra-spring-2010/',
+        'https://ocw.mit.edu/courses/18-05-introduction-to-probability-and-statistics-spring-2014/'
+    ],
+    'physics': [
+        'https://ocw.mit.edu/courses/8-01sc-classical-mechanics-fall-2016/',
+        'https://ocw.mit.edu/courses/8-02-physics-ii-electricity-and-magnetism-spring-2007/',
+        'https://ocw.mit.edu/courses/8-04-quantum-physics-i-spring-2013/'
+    ],
+    'economics': [
+        'https://ocw.mit.edu/courses/14-01-principles-of-microeconomics-fall-2018/',
+        'https://ocw.mit.edu/courses/14-02-principles-of-macroeconomics-spring-2014/',
+        'https://ocw.mit.edu/courses/15-501-introduction-to-financial-and-managerial-accounting-spring-2004/'
+    ]
+}
+
+
+def _build_word_index(courses_by_category: Dict[str, List[str]]) -> Dict[str, List[str]]:
+    """Map each category, and each word in it, to that category's course URLs"""
+    index = defaultdict(list)
+    for category, urls in courses_by_category.items():
+        for word in {category, *category.split()}:
+            index[word].extend(urls)
+    return dict(index)
+
+
+# Built once, so a search checks each category word against the topic only once
+WORD_TO_URLS = _build_word_index(MIT_COURSES)
+
+# Compiled once; candidates are tried in order of preference
+TITLE_XPATHS = (
+    etree.XPath('(//h1)[1]'),
+    etree.XPath('(//title)[1]'),
+)
+DESCRIPTION_XPATHS = (
+    etree.XPath(_class_xpath('course-description')),
+    etree.XPath(_class_xpath('description')),
+    etree.XPath('(//meta[@name="description"])[1]'),
+    etree.XPath(_class_xpath('course-intro')),
+    etree.XPath('(//p)[1]'),
+)
+
+
+@dataclass(slots=True)
+class MITCourse(Course):
+    """A scraped MIT OpenCourseWare course"""
+    id: str
+    title: str
+    provider: str
+    url: str
+    description: str
+    duration_hours: int
+    level: str
+    format: str
+    skills: List[str]
+    subject: str
+    course_number: str
+    rating: float
+    enrollment_count: int
+    source_platform: str
 
 
 class MITScraper(BaseScraper):
     """Scraper for MIT OpenCourseWare"""
     
+    # OCW course pages change on a scale of months
+    cache_name = "mit_ocw"
+    
     def __init__(self):
         super().__init__()
         self.base_url = "https://ocw.mit.edu"
         self.search_url = "https://ocw.mit.edu/search/"
+        self.max_workers = 6  # Concurrent course page fetches
         
     def search_courses(self, topic: str, count: int) -> List[Dict]:
         """Search for courses on MIT OCW using predefined popular courses"""
-        courses = []
+        return list(self.iter_courses(topic, count))
+    
+    def iter_courses(self, topic: str, count: int) -> Iterator[Dict]:
+        """Yield MIT OCW courses in the order their pages finish downloading"""
+        courses_found = 0
         
         print(f"🏫 Searching MIT OpenCourseWare for '{topic}'...")
         
-        # Popular MIT OCW courses organized by topic
-        mit_courses = {
-            'computer science': [
-                'https://ocw.mit.edu/courses/6-0001-introduction-to-computer-science-and-programming-in-python-fall-2016/',
-                'https://ocw.mit.edu/courses/6-006-introduction-to-algorithms-fall-2011/',
-                'https://ocw.mit.edu/courses/6-046j-design-and-analysis-of-algorithms-spring-2015/',
-                'https://ocw.mit.edu/courses/6-034-artificial-intelligence-fall-2010/',
-                'https://ocw.mit.edu/courses/6-00sc-introduction-to-computer-science-and-programming-spring-2011/'
-            ],
-            'programming': [
-                'https://ocw.mit.edu/courses/6-0001-introduction-to-computer-science-and-programming-in-python-fall-2016/',
-                'https://ocw.mit.edu/courses/6-00sc-introduction-to-computer-science-and-programming-spring-2011/',
-                'https://ocw.mit.edu/courses/6-189-a-gentle-introduction-to-programming-using-python-january-iap-2011/'
-            ],
-            'machine learning': [
-                'https://ocw.mit.edu/courses/6-034-artificial-intelligence-fall-2010/',
-                'https://ocw.mit.edu/courses/6-867-machine-learning-fall-2006/',
-                'https://ocw.mit.edu/courses/9-520-statistical-learning-theory-and-applications-spring-2003/'
-            ],
-            'artificial intelligence': [
-                'https://ocw.mit.edu/courses/6-034-artificial-intelligence-fall-2010/',
-                'https://ocw.mit.edu/courses/6-825-techniques-in-artificial-intelligence-sma-5504-fall-2002/'
-            ],
-            'mathematics': [
-                'https://ocw.mit.edu/courses/18-01sc-single-variable-calculus-fall-2010/',
-                'https://ocw.mit.edu/courses/18-02sc-multivariable-calculus-fall-2010/',
-                'https://ocw.mit.edu/courses/18-06-linear-algebra-spring-2010/',
-                'https://ocw.mit.edu/courses/18-05-introduction-to-probability-and-statistics-spring-2014/'
-            ],
-            'physics': [
-                'https://ocw.mit.edu/courses/8-01sc-classical-mechanics-fall-2016/',
-                'https://ocw.mit.edu/courses/8-02-physics-ii-electricity-and-magnetism-spring-2007/',
-                'https://ocw.mit.edu/courses/8-04-quantum-physics-i-spring-2013/'
-            ],
-            'economics': [
-                'https://ocw.mit.edu/courses/14-01-principles-of-microeconomics-fall-2018/',
-                'https://ocw.mit.edu/courses/14-02-principles-of-macroeconomics-spring-2014/',
-                'https://ocw.mit.edu/courses/15-501-introduction-to-financial-and-managerial-accounting-spring-2004/'
-            ]
-        }
-        
-        # Find relevant courses based on topic
+        # Match index words anywhere in the topic, as the old per-category scan did,
+        # so 'machine-learning' and 'macroeconomics' still find their courses
         topic_lower = topic.lower()
-        relevant_urls = []
-        
-        for category, urls in mit_courses.items():
-            if any(word in topic_lower for word in category.split()) or category in topic_lower:
-                relevant_urls.extend(urls)
+        relevant_urls = [
+            url
+            for word, urls in WORD_TO_URLS.items()
+            if word in topic_lower
+            for url in urls
+        ]
         
         # If no specific match, use computer science as default
         if not relevant_urls:
-            relevant_urls = mit_courses.get('computer science', [])
+            relevant_urls = MIT_COURSES['computer science']
         
-        # Remove duplicates and limit count
-        relevant_urls = list(set(relevant_urls))[:count]
+        # Remove duplicates (keeping order) and limit count
+        relevant_urls = list(dict.fromkeys(relevant_urls))[:count]
         
         print(f"   Found {len(relevant_urls)} relevant course URLs")
         
-        # Extract course data from each URL
-        for i, url in enumerate(relevant_urls):
-            try:
-                print(f"   Processing course {i+1}/{len(relevant_urls)}")
-                course_data = self.extract_course_from_url(url)
-                if course_data:
-                    courses.append(course_data)
-                
-                # Rate limiting
-                time.sleep(random.uniform(*self.delay_range))
+        # Extract course data from the URLs concurrently
+        executor = ThreadPoolExecutor(max_workers=self.max_workers)
+        try:
+            futures = {executor.submit(self._fetch_course, url): url for url in relevant_urls}
+            
+            for i, future in enumerate(as_completed(futures), 1):
+                url = futures[future]
+                try:
+                    course_data = future.result()
+                    print(f"   Processed course {i}/{len(relevant_urls)}")
+                    
+                except Exception as e:
+                    print(f"   ⚠️ Error extracting course from {url}: {e}")
+                    continue
                 
-            except Exception as e:
-                print(f"   ⚠️ Error extracting course from {url}: {e}")
-                continue
+                if course_data:
+                    courses_found += 1
+                    yield course_data.to_dict()
+        
+        finally:
+            # Don't start pending downloads if the caller stopped consuming early
+            executor.shutdown(wait=False, cancel_futures=True)
                 
-        print(f"✅ Successfully scraped {len(courses)} courses from MIT")
-        return courses
+        print(f"✅ Successfully scraped {courses_found} courses from MIT")
+    
+    def _fetch_course(self, url: str) -> Optional[MITCourse]:
+        """Fetch a course page from a worker thread once the shared rate limit allows it"""
+        self.wait_for_request_slot()
+        return self.extract_course_from_url(url)
     
-    def extract_course_from_url(self, url: str) -> Dict:
+    def extract_course_from_url(self, url: str) -> Optional[MITCourse]:
         """Extract course data from a course URL"""
         try:
-            response = requests.get(url, timeout=30)
+            response = self.session.get(url, timeout=30)
             response.raise_for_status()
             
-            soup = BeautifulSoup(response.content, 'html.parser')
+            tree = lxml_html.fromstring(response.content)
             
-            return self.extract_course_data(soup, url)
+            return self.extract_course_data(tree, url)
             
         except Exception as e:
             print(f"   Error fetching course page {url}: {e}")
             return None
     
-    def extract_course_data(self, soup: BeautifulSoup, url: str) -> Dict:
-        """Extract course data from course page soup"""
+    def extract_course_data(self, tree: lxml_html.HtmlElement, url: str) -> MITCourse:
+        """Extract course data from the parsed course page"""
         
         # Extract title
         title = ""
-        title_elem = soup.find('h1') or soup.find('title')
-        if title_elem:
-            title = title_elem.get_text(strip=True)
+        title_elem = self._first_match(tree, TITLE_XPATHS)
+        if title_elem is not None:
+            title = title_elem.text_content().strip()
             # Clean up title
-            title = re.sub(r'\\s*\\|\\s*MIT OpenCourseWare', '', title)
-            title = re.sub(r'^[\\d\\.]+\\s*\\|\\s*', '', title)  # Remove course number prefix
+            title = TITLE_SUFFIX_RE.sub('', title)
+            title = COURSE_PREFIX_RE.sub('', title)  # Remove course number prefix
         
         # Extract description
         description = ""
-        desc_selectors = [
-            '.course-description',
-            '.description', 
-            'meta[name="description"]',
-            '.course-intro',
-            'p'
-        ]
-        
-        for selector in desc_selectors:
-            desc_elem = soup.select_one(selector)
-            if desc_elem:
-                if desc_elem.name == 'meta':
+        for desc_xpath in DESCRIPTION_XPATHS:
+            matches = desc_xpath(tree)
+            if matches:
+                desc_elem = matches[0]
+                if desc_elem.tag == 'meta':
                     description = desc_elem.get('content', '')
                 else:
-                    description = desc_elem.get_text(strip=True)
+                    description = desc_elem.text_content().strip()
                 if description and len(description) > 50:
                     break
         
@@ -156,23 +248,24 @@ class MITScraper(BaseScraper):
         level = "Unknown"
         course_num = ""
         
-        # Look for course number in URL or title
-        course_num_match = re.search(r'(\\d+[\\w\\.]*)', url)
+        # Read the course number from the URL slug
+        course_num_match = COURSE_NUMBER_RE.search(url)
         if course_num_match:
-            course_num = course_num_match.group(1)
+            department, number = course_num_match.groups()
+            course_num = f"{department}.{number.upper()}"
             
-        # Determine level based on course number
-        if course_num:
-            if course_num.startswith(('1', '2', '3', '6.00')):
+            # Determine level from the department; Course 6's 6.0xx/6.1xx subjects
+            # are its introductory undergraduate series
+            if department in UNDERGRADUATE_DEPARTMENTS or (department == '6' and number[0] in '01'):
                 level = "Undergraduate"
-            elif course_num.startswith(('6.', '15.', '18.')):
+            elif department in ADVANCED_DEPARTMENTS:
                 level = "Advanced"
             else:
                 level = "Intermediate"
         
         # Extract department/subject
         subject = ""
-        dept_match = re.search(r'/courses/([^/]+)', url)
+        dept_match = DEPARTMENT_RE.search(url)
         if dept_match:
             subject = dept_match.group(1).replace('-', ' ').title()
         
@@ -187,44 +280,39 @@ class MITScraper(BaseScraper):
             duration_hours = 45  # Regular courses
         
         # Extract skills from title and description
-        skills = self.extract_skills_from_text(f"{title} {description}")
-        
-        course_data = {
-            "id": str(uuid.uuid4()),
-            "title": title,
-            "provider": "MIT OpenCourseWare",
-            "url": url,
-            "description": description,
-            "duration_hours": duration_hours,
-            "level": level,
-            "format": "Online",
-            "skills": skills,
-            "subject": subject,
-            "course_number": course_num,
-            "rating": 4.8,  # MIT OCW is generally high quality
-            "enrollment_count": 0,  # Not available for OCW
-            "source_platform": "mit_ocw"
-        }
+        skills = self.extract_skills_from_text(title, description)
+        
+        course_data = MITCourse(
+            id=self.course_id_for_url(url),
+            title=title,
+            provider="MIT OpenCourseWare",
+            url=url,
+            description=description,
+            duration_hours=duration_hours,
+            level=level,
+            format="Online",
+            skills=skills,
+            subject=subject,
+            course_number=course_num,
+            rating=4.8,  # MIT OCW is generally high quality
+            enrollment_count=0,  # Not available for OCW
+            source_platform="mit_ocw"
+        )
         
         return course_data
     
-    def extract_skills_from_text(self, text: str) -> List[str]:
-        """Extract potential skills from course text"""
-        skills = []
-        text_lower = text.lower()
-        
-        # Common technical skills
-        tech_skills = [
-            'python', 'java', 'javascript', 'c++', 'c programming', 'sql',
-            'machine learning', 'artificial intelligence', 'data analysis',
-            'statistics', 'calculus', 'linear algebra', 'probability',
-            'algorithms', 'programming', 'software engineering',
-            'computer science', 'mathematics', 'physics', 'chemistry',
-            'biology', 'economics', 'finance', 'management'
-        ]
-        
-        for skill in tech_skills:
-            if skill in text_lower:
-                skills.append(skill.title())
+    def _first_match(self, tree: lxml_html.HtmlElement, xpaths):
+        """Return the first element matched by the given XPaths, tried in order"""
+        for xpath in xpaths:
+            matches = xpath(tree)
+            if matches:
+                return matches[0]
+        return None
+    
+    def extract_skills_from_text(self, *texts: str) -> List[str]:
+        """Extract potential skills from one or more pieces of course text"""
+        # Each text is scanned as-is; only the few matched keywords get lowercased
+        found = {match.lower() for text in texts for match in SKILL_RE.findall(text)}
         
-        return skills
+        # Keep the keyword order stable for the output
+        return [skill.title() for skill in SKILL_KEYWORDS if skill in found]
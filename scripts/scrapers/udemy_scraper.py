@@ -3,14 +3,30 @@ Udemy scraper implementation - Enhanced version based on Medium article techniqu
 """
 
 import requests
-from bs4 import BeautifulSoup
-from typing import List, Dict
+from lxml import etree
+from typing import List, Dict, Iterator
 import time
 import random
 from urllib.parse import quote_plus
+from urllib3.util.retry import Retry
 from .base_scraper import BaseScraper
 
 
+def is_course_href(href) -> bool:
+    """Match links that point at a Udemy course page"""
+    return bool(href) and '/course/' in href
+
+
+def element_text(element) -> str:
+    """Concatenate the stripped text pieces of an lxml element, like bs4's get_text(strip=True)"""
+    return ''.join(text.strip() for text in element.itertext())
+
+
+# First heading inside the nearest ancestor of a link that contains any heading
+HEADING = "*[self::h1 or self::h2 or self::h3 or self::h4 or self::h5 or self::h6]"
+ANCESTOR_HEADING_XPATH = etree.XPath(f"(ancestor::*[.//{HEADING}][1]//{HEADING})[1]")
+
+
 class UdemyScraper(BaseScraper):
     """Enhanced Udemy scraper with better anti-detection measures"""
     
@@ -24,7 +40,6 @@ class UdemyScraper(BaseScraper):
             'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,image/apng,*/*;q=0.8',
             'Accept-Language': 'en-US,en;q=0.8',
-            'Accept-Encoding': 'gzip, deflate, br',
             'DNT': '1',
             'Connection': 'keep-alive',
             'Upgrade-Insecure-Requests': '1',
@@ -36,14 +51,27 @@ class UdemyScraper(BaseScraper):
             'Referer': 'https://www.udemy.com/'
         }
         
-        # Initialize session for better cookie and state management
-        self.session = requests.Session()
+        # Send the browser headers with every request made through the shared session
         self.session.headers.update(self.headers)
         self.delay_range = (3, 6)  # Longer delays for Udemy
     
+    def _retry_policy(self) -> Retry:
+        """Back off harder than the other platforms, since Udemy throttles scrapers quickly"""
+        # A Retry-After header on 429/503 overrides the exponential backoff
+        return super()._retry_policy().new(
+            total=5,
+            backoff_factor=2,
+            respect_retry_after_header=True
+        )
+    
     def search_courses(self, topic: str, count: int) -> List[Dict]:
         """Enhanced search for courses on Udemy using alternative endpoints"""
-        courses = []
+        return list(self.iter_courses(topic, count))
+    
+    def iter_courses(self, topic: str, count: int) -> Iterator[Dict]:
+        """Yield Udemy courses as soon as each one is extracted"""
+        found = 0
+        topic_lower = topic.lower()  # Lowercased once for every title check
         
         try:
             # First visit the homepage to establish session (Medium article technique)
@@ -75,30 +103,36 @@ class UdemyScraper(BaseScraper):
                     approach['url'], 
                     params=approach['params'],
                     timeout=(5, 60),
-                    allow_redirects=True
+                    allow_redirects=True,
+                    stream=True
                 )
                 
                 if response.status_code == 200:
-                    soup = BeautifulSoup(response.content, 'html.parser')
-                    
-                    # Try to find course links or data
-                    # Look for any links that contain '/course/'
-                    course_links = soup.find_all('a', href=lambda x: x and '/course/' in x)
+                    course_links = self._stream_course_links(response)
                     
                     if course_links:
                         print(f"    Found {len(course_links)} course links")
                         
-                        # Extract course information from links
-                        for link in course_links[:count]:
+                        # Extract course information from links. A course is usually linked
+                        # several times (image, title, call to action), so links are deduped
+                        # on the URL without its query string. A URL only counts as seen once
+                        # a real title was found for it, so a bare image link doesn't hide
+                        # the titled link that follows.
+                        seen_urls = set()
+                        for link in course_links:
                             try:
-                                course_url = link.get('href')
+                                course_url = link.get('href').split('?')[0]
                                 if not course_url.startswith('http'):
                                     course_url = self.base_url + course_url
+                                if course_url in seen_urls:
+                                    continue
                                 
                                 # Get course title from link text or parent elements
                                 title = self._extract_title_from_link(link)
+                                if title != "Unknown Course":
+                                    seen_urls.add(course_url)
                                 
-                                if title and topic.lower() in title.lower():
+                                if title and topic_lower in title.lower():
                                     course_data = {
                                         'title': title,
                                         'provider': 'Udemy',
@@ -114,23 +148,24 @@ class UdemyScraper(BaseScraper):
                                         'certificate': True,
                                     }
                                     
-                                    standardized = self.standardize_course_data(course_data)
-                                    courses.append(standardized)
+                                    yield self.standardize_course_data(course_data)
+                                    found += 1
                                     
-                                    if len(courses) >= count:
+                                    if found >= count:
                                         break
                                         
                             except Exception as e:
                                 print(f"    Error processing course link: {e}")
                                 continue
                         
-                        if courses:
+                        if found:
                             break  # Found courses, no need to try other approaches
                     
                     else:
                         print(f"    No course links found in this approach")
                 
                 else:
+                    response.close()
                     print(f"    Approach failed with status: {response.status_code}")
                     
         except requests.exceptions.Timeout:
@@ -139,28 +174,49 @@ class UdemyScraper(BaseScraper):
             print(f"    Error searching Udemy: {e}")
         except Exception as e:
             print(f"    Unexpected error: {e}")
-            
-        return courses
+    
+    def _stream_course_links(self, response) -> List[etree._Element]:
+        """
+        Feed a streamed response into lxml's incremental parser as it downloads
+        
+        Returns the <a> elements that point at course pages. The whole tree is kept,
+        so titles can still be looked up in a link's ancestors once parsing is done.
+        """
+        parser = etree.HTMLPullParser(
+            events=('end',), tag='a', encoding=self.declared_encoding(response)
+        )
+        course_links = []
+        
+        try:
+            for chunk in response.iter_content(chunk_size=65536):
+                parser.feed(chunk)
+                course_links.extend(
+                    element for _, element in parser.read_events()
+                    if is_course_href(element.get('href'))
+                )
+        finally:
+            response.close()
+        
+        parser.close()
+        course_links.extend(
+            element for _, element in parser.read_events()
+            if is_course_href(element.get('href'))
+        )
+        return course_links
     
     def _extract_title_from_link(self, link) -> str:
         """Extract course title from a course link element"""
         # Try different methods to get the title
-        title = link.get_text(strip=True)
+        title = element_text(link)
         if title:
             return title
             
         # Look in parent elements
-        parent = link.parent
-        while parent and not title:
-            title_elem = parent.find(['h1', 'h2', 'h3', 'h4', 'h5', 'h6'])
-            if title_elem:
-                title = title_elem.get_text(strip=True)
-                break
-            parent = parent.parent
+        title_elems = ANCESTOR_HEADING_XPATH(link)
+        if title_elems:
+            title = element_text(title_elems[0])
             
         return title or "Unknown Course"
-            
-        return courses
     
     def extract_course_data(self, course_element) -> Dict:
         """Extract course data from Udemy course card"""
@@ -4,9 +4,17 @@ Test Academic Scraper - Limited Topics
 """
 
 import subprocess
-import time
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 
+# Seconds a single scrape may run before it is killed
+SCRAPE_TIMEOUT = 120
+
+# Last output lines kept to report a failed scrape
+OUTPUT_TAIL_LINES = 20
+
 def run_scraper(platform, topic, count=3):
     """Run the scraper for a specific platform and topic"""
     cmd = [
@@ -19,12 +27,40 @@ def run_scraper(platform, topic, count=3):
     print(f"🚀 Scraping {count} '{topic}' courses from {platform}...")
     
     try:
-        result = subprocess.run(cmd, capture_output=True, text=True, timeout=120)
-        if result.returncode == 0:
+        # Stream the combined output line by line instead of buffering it all;
+        # several scrapes run at once, so each line is tagged with its job
+        process = subprocess.Popen(
+            cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True, errors="replace"
+        )
+        timed_out = threading.Event()
+        
+        def kill_on_timeout():
+            timed_out.set()
+            process.kill()
+        
+        timer = threading.Timer(SCRAPE_TIMEOUT, kill_on_timeout)
+        timer.start()
+        
+        output_tail = deque(maxlen=OUTPUT_TAIL_LINES)
+        try:
+            for line in process.stdout:
+                line = line.rstrip()
+                print(f"   [{platform}/{topic}] {line}")
+                output_tail.append(line)
+            process.wait()
+        finally:
+            timer.cancel()
+            process.stdout.close()
+        
+        if timed_out.is_set():
+            raise subprocess.TimeoutExpired(cmd, SCRAPE_TIMEOUT)
+        
+        if process.returncode == 0:
             print(f"✅ Successfully scraped {topic} from {platform}")
             return True
         else:
-            print(f"❌ Error scraping {topic} from {platform}: {result.stderr}")
+            output = "\n".join(output_tail)
+            print(f"❌ Error scraping {topic} from {platform}: {output}")
             return False
     except Exception as e:
         print(f"❌ Exception scraping {topic} from {platform}: {e}")
@@ -46,10 +82,17 @@ def main():
     
     print(f"🧪 Test scraping for {len(topics)} topics across {len(platforms)} platforms")
     
-    for topic in topics:
-        for platform in platforms:
-            success = run_scraper(platform, topic, courses_per_topic)
-            time.sleep(1)  # Short delay
+    # Each scrape is an independent subprocess, so they run side by side; each
+    # scraper still keeps its own delays between requests
+    jobs = [(platform, topic) for topic in topics for platform in platforms]
+    
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        futures = {
+            executor.submit(run_scraper, platform, topic, courses_per_topic): (platform, topic)
+            for platform, topic in jobs
+        }
+        for future in as_completed(futures):
+            future.result()
     
     print(f"\n🎉 Test scraping completed!")
 
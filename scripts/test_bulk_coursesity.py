@@ -3,9 +3,10 @@
 Test bulk Coursesity scraping with a smaller set first.
 """
 
-import subprocess
-import time
+import asyncio
 import random
+import re
+from collections import deque
 from pathlib import Path
 
 # Test with just a few high-volume topics first
@@ -22,13 +23,18 @@ TEST_TOPICS = [
     "cooking"
 ]
 
-def run_scraper(platform, topic, count=50):
+# Course count reported by course_scraper.py
+COURSES_FOUND_RE = re.compile(r'(\d+) courses found')
+
+# Scrapes allowed to run at the same time; each one is a separate scraper process
+MAX_CONCURRENT_SCRAPES = 3
+
+# Last stderr lines kept to report a failed scrape
+STDERR_TAIL_LINES = 20
+
+async def run_scraper(platform, topic, count=50):
     """Run the course scraper for a specific platform and topic with high count"""
     try:
-        print(f"\n{'='*60}")
-        print(f"Scraping {platform} for '{topic}' (target: {count} courses)")
-        print(f"{'='*60}")
-        
         cmd = [
             "pipenv", "run", "python", "scripts/course_scraper.py",
             "--platform", platform,
@@ -36,49 +42,93 @@ def run_scraper(platform, topic, count=50):
             "--count", str(count)
         ]
         
-        result = subprocess.run(cmd, capture_output=True, text=True, cwd=".")
+        print(f"🚀 Scraping {platform} for '{topic}' (target: {count} courses)")
+        
+        process = await asyncio.create_subprocess_exec(
+            *cmd,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            cwd=".",
+            limit=1024 * 1024  # Longest output line accepted
+        )
+        
+        # Output is streamed line by line, prefixed with the topic since several
+        # scrapes print at once; only the course count and a stderr tail are kept
+        courses_found = None
+        stderr_tail = deque(maxlen=STDERR_TAIL_LINES)
+        
+        async def read_stdout():
+            nonlocal courses_found
+            async for raw_line in process.stdout:
+                line = raw_line.decode(errors="replace").rstrip()
+                print(f"   [{topic}] {line}")
+                match = COURSES_FOUND_RE.search(line)
+                if match:
+                    courses_found = match.group(1)
+        
+        async def read_stderr():
+            async for raw_line in process.stderr:
+                stderr_tail.append(raw_line.decode(errors="replace").rstrip())
+        
+        await asyncio.gather(read_stdout(), read_stderr())
+        await process.wait()
         
-        if result.returncode == 0:
+        if process.returncode == 0:
             print(f"✅ Successfully scraped {platform} for '{topic}'")
             # Count courses from output
-            if "courses found" in result.stdout:
-                import re
-                match = re.search(r'(\d+) courses found', result.stdout)
-                if match:
-                    print(f"   📚 Found {match.group(1)} courses")
-            print(result.stdout)
+            if courses_found:
+                print(f"   📚 Found {courses_found} courses")
         else:
-            print(f"❌ Error scraping {platform} for '{topic}': {result.stderr}")
+            stderr = "\n".join(stderr_tail)
+            print(f"❌ Error scraping {platform} for '{topic}': {stderr}")
             
-        return result.returncode == 0
+        return process.returncode == 0
         
     except Exception as e:
         print(f"❌ Exception scraping {platform} for '{topic}': {e}")
         return False
 
-def main():
-    print("🧪 Testing bulk Coursesity scraping with sample topics...")
-    print(f"📋 Will test {len(TEST_TOPICS)} topics with 50 courses each")
-    print(f"🎯 Test target: {len(TEST_TOPICS) * 50} = {len(TEST_TOPICS) * 50:,} additional courses")
+async def scrape_topic(semaphore, index, topic):
+    """Scrape one topic once a concurrency slot is free"""
+    async with semaphore:
+        # Add delay between scrapes to be respectful (the first wave starts right away)
+        if index > MAX_CONCURRENT_SCRAPES:
+            delay = random.uniform(3, 7)
+            print(f"⏱️  Waiting {delay:.1f}s before scraping '{topic}'...")
+            await asyncio.sleep(delay)
+        
+        return await run_scraper("coursesity", topic, count=50)
+
+async def main_async():
+    """Scrape all test topics concurrently, returning (successful, failed) counts"""
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_SCRAPES)
+    # Tasks are created up front so topics take the free slots in list order
+    tasks = [
+        asyncio.create_task(scrape_topic(semaphore, i, topic))
+        for i, topic in enumerate(TEST_TOPICS, 1)
+    ]
     
     successful_scrapes = 0
     failed_scrapes = 0
     
-    for i, topic in enumerate(TEST_TOPICS, 1):
-        print(f"\n📊 Progress: {i}/{len(TEST_TOPICS)} topics")
-        
-        success = run_scraper("coursesity", topic, count=50)
+    for i, task in enumerate(asyncio.as_completed(tasks), 1):
+        success = await task
         
         if success:
             successful_scrapes += 1
         else:
             failed_scrapes += 1
-            
-        # Add delay between scrapes to be respectful
-        if i < len(TEST_TOPICS):  # Don't delay after the last one
-            delay = random.uniform(3, 7)
-            print(f"⏱️  Waiting {delay:.1f}s before next scrape...")
-            time.sleep(delay)
+        
+        print(f"\n📊 Progress: {i}/{len(TEST_TOPICS)} topics")
+    
+    return successful_scrapes, failed_scrapes
+
+def main():
+    print("🧪 Testing bulk Coursesity scraping with sample topics...")
+    print(f"📋 Will test {len(TEST_TOPICS)} topics with 50 courses each")
+    print(f"🎯 Test target: {len(TEST_TOPICS) * 50} = {len(TEST_TOPICS) * 50:,} additional courses")
+    
+    successful_scrapes, failed_scrapes = asyncio.run(main_async())
     
     print(f"\n🎉 Test scraping completed!")
     print(f"✅ Successful scrapes: {successful_scrapes}")
@@ -1,25 +1,23 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 
-from langchain.vectorstores import Chroma
-from langchain.embeddings import HuggingFaceEmbeddings
+import chromadb
 
-embedding_model = HuggingFaceEmbeddings(model_name="all-MiniLM-L6-v2")
-courses_collection = Chroma(
-    persist_directory="data/courses_chroma",
-    embedding_function=embedding_model
-)
+# Inspect the store with Chroma's own client: reading stored documents needs no
+# embedding model, so none is loaded. LangChain saves to the "langchain" collection.
+client = chromadb.PersistentClient(path="data/courses_chroma")
+courses_collection = client.get_collection("langchain")
 
 # Print number of stored courses
 try:
-    n_courses = courses_collection._collection.count()
+    n_courses = courses_collection.count()
     print(f"Number of stored courses in Chroma: {n_courses}")
 except Exception as e:
     print(f"Could not count courses: {e}")
 
 # Print a few sample documents (if any)
 try:
-    docs = courses_collection._collection.get(limit=3)
+    docs = courses_collection.get(limit=3, include=["documents"])
     print("Sample documents:")
     for i, doc in enumerate(docs["documents"]):
         print(f"--- Document {i+1} ---")
@@ -4,25 +4,74 @@ Upload updated ChromaDB archive to HuggingFace datasets repository.
 """
 
 import os
+import hashlib
+import shutil
+import subprocess
 import tarfile
-import json
+import orjson
+from importlib.util import find_spec
+
+# Upload through hf_transfer's multi-connection client when it is installed; the
+# flag is read when huggingface_hub is imported, so it must be set before that
+if find_spec("hf_transfer") is not None:
+    os.environ.setdefault("HF_HUB_ENABLE_HF_TRANSFER", "1")
+
 from huggingface_hub import HfApi, login
 from pathlib import Path
 
+def directory_fingerprint(root):
+    """Hash the relative path, size and mtime of every file under root."""
+    digest = hashlib.sha256()
+    pending = [root]
+    
+    while pending:
+        with os.scandir(pending.pop()) as entries:
+            for entry in sorted(entries, key=lambda e: e.name):
+                if entry.is_dir(follow_symlinks=False):
+                    pending.append(entry.path)
+                else:
+                    stat = entry.stat(follow_symlinks=False)
+                    rel_path = os.path.relpath(entry.path, root)
+                    digest.update(f"{rel_path}\0{stat.st_size}\0{stat.st_mtime_ns}\n".encode())
+    
+    return digest.hexdigest()
+
 def create_courses_tarball():
     """Create a compressed tarball of the courses ChromaDB."""
     chroma_dir = "data/courses_chroma"
     output_file = "data/courses_chroma.tar.gz"
+    stamp_file = output_file + ".stamp"
     
     if not os.path.exists(chroma_dir):
         print(f"❌ Error: {chroma_dir} not found!")
         return False
     
+    # Skip recompressing when nothing in the ChromaDB changed since the last tarball
+    fingerprint = directory_fingerprint(chroma_dir)
+    if os.path.exists(output_file) and os.path.exists(stamp_file):
+        with open(stamp_file, 'r') as f:
+            if f.read().strip() == fingerprint:
+                print(f"✅ {output_file} is up to date, skipping rebuild")
+                return True
+    
     print(f"📦 Creating tarball from {chroma_dir}...")
     
     try:
-        with tarfile.open(output_file, "w:gz") as tar:
-            tar.add(chroma_dir, arcname="courses_chroma")
+        # The app extracts this archive as tar.gz, so the format stays gzip; pigz
+        # compresses it on all cores when installed
+        pigz = shutil.which("pigz")
+        if pigz:
+            subprocess.run(
+                ["tar", f"--use-compress-program={pigz}", "-cf", output_file,
+                 "-C", os.path.dirname(chroma_dir), os.path.basename(chroma_dir)],
+                check=True
+            )
+        else:
+            with tarfile.open(output_file, "w:gz", compresslevel=6) as tar:
+                tar.add(chroma_dir, arcname="courses_chroma")
+        
+        with open(stamp_file, 'w') as f:
+            f.write(fingerprint)
         
         file_size = os.path.getsize(output_file)
         print(f"✅ Created {output_file} ({file_size / 1024 / 1024:.1f} MB)")
@@ -35,8 +84,8 @@ def create_courses_tarball():
 def get_catalog_stats():
     """Get current catalog statistics for commit message."""
     try:
-        with open("data/course_catalog_esco.json", 'r') as f:
-            catalog = json.load(f)
+        with open("data/course_catalog_esco.json", 'rb') as f:
+            catalog = orjson.loads(f.read())
         
         total_courses = len(catalog['courses'])
         total_skills = sum(len(course.get('skills', [])) for course in catalog['courses'])
@@ -49,21 +49,25 @@ def test_feedback_interpretation():
     ]
     
     print("\n=== Test Courses ===")
-    for course in test_courses:
-        print(f"- {course['title']} ({course['level']})")
+    sys.stdout.write("".join(f"- {course['title']} ({course['level']})\n" for course in test_courses))
     
     print("\n=== Getting Recommendations ===")
     recommendations = justify_recommendations(profile, test_courses)
     
     print("\n=== Recommendations with Justifications ===")
+    lines = []
     for i, rec in enumerate(recommendations, 1):
-        print(f"\n{i}. {rec['title']}")
-        print(f"   Justification: {rec['justification']}")
+        lines.append(f"\n{i}. {rec['title']}")
+        lines.append(f"   Justification: {rec['justification']}")
         
         # Check if it mentions beginner inappropriately
         justification_lower = rec['justification'].lower()
         if 'beginner' in justification_lower and 'avoid' not in justification_lower and 'not' not in justification_lower:
-            print(f"   ⚠️  WARNING: May be incorrectly interpreting beginner feedback!")
+            lines.append(f"   ⚠️  WARNING: May be incorrectly interpreting beginner feedback!")
+    
+    # Written in one go rather than a print per line
+    if lines:
+        sys.stdout.write("\n".join(lines) + "\n")
 
 if __name__ == "__main__":
     test_feedback_interpretation()
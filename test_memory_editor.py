@@ -9,6 +9,9 @@ sys.path.append('.')
 
 # Test the memory editor functions
 from coachable_course_agent.memory_store import (
+    load_user_profile,
+    update_user_profile,
+    _profile_path,
     format_memory_editor_display,
     update_goal_dialog,
     save_updated_goal,
@@ -52,5 +55,38 @@ def test_memory_editor():
     
     print("\n=== Test Complete! ===")
 
+def test_profile_cache_invalidation():
+    # Throwaway user, so the cached-read checks never touch a real profile
+    user_id = "cache_test_user"
+    path = _profile_path(user_id)
+    
+    print("\n=== Testing Profile Cache Invalidation ===")
+    
+    try:
+        # Test 1: Rewrite within the same mtime tick
+        print("\n1. Rewriting a cached profile with the same size and mtime:")
+        update_user_profile(user_id, {"goal": "first"})
+        stat = os.stat(path)
+        assert load_user_profile(user_id)["goal"] == "first"
+        update_user_profile(user_id, {"goal": "again"})
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        reloaded = load_user_profile(user_id)
+        print(f"Reloaded goal: '{reloaded['goal']}'")
+        assert reloaded["goal"] == "again", "stale cached profile returned after update_user_profile"
+        
+        # Test 2: External edit picked up through the (mtime, size) signature
+        print("\n2. Editing the profile file outside update_user_profile:")
+        with open(path, 'w') as f:
+            f.write('{"goal": "edited outside the app"}')
+        reloaded = load_user_profile(user_id)
+        print(f"Reloaded goal: '{reloaded['goal']}'")
+        assert reloaded["goal"] == "edited outside the app", "stale cached profile returned after external edit"
+    finally:
+        if os.path.exists(path):
+            os.remove(path)
+    
+    print("\n=== Cache Test Complete! ===")
+
 if __name__ == "__main__":
     test_memory_editor()
+    test_profile_cache_invalidation()
@@ -1,36 +1,63 @@
 #!/usr/bin/env python3
 """Test script to verify the GradioOutputManager works correctly."""
 
+import sys
+
 class GradioOutputManager:
     """Manages Gradio outputs by name instead of index to prevent order-related bugs."""
     
+    __slots__ = ('output_names', 'output_map', '_values')
+    
     def __init__(self, output_names):
         """Initialize with a list of output component names in the expected order."""
-        self.output_names = output_names
-        self.output_map = {name: idx for idx, name in enumerate(output_names)}
-        self._values = [None] * len(output_names)
+        # Interned names let set() lookups with literal names match by identity
+        self.output_names = tuple(sys.intern(name) for name in output_names)
+        self.output_map = {name: idx for idx, name in enumerate(self.output_names)}
+        self._values = [None] * len(self.output_names)
     
     def set(self, name, value):
         """Set a value for a named output."""
-        if name not in self.output_map:
-            raise ValueError(f"Unknown output name: {name}. Available: {list(self.output_map.keys())}")
-        self._values[self.output_map[name]] = value
+        try:
+            self._values[self.output_map[name]] = value
+        except KeyError:
+            raise ValueError(f"Unknown output name: {name}. Available: {list(self.output_map.keys())}") from None
         return self
     
     def set_multiple(self, **kwargs):
         """Set multiple outputs at once."""
+        output_map = self.output_map
+        values = self._values
         for name, value in kwargs.items():
-            self.set(name, value)
+            idx = output_map.get(name)
+            if idx is None:
+                raise ValueError(f"Unknown output name: {name}. Available: {list(output_map.keys())}")
+            values[idx] = value
         return self
     
     def get_tuple(self):
         """Return the values as a tuple in the correct order."""
         return tuple(self._values)
     
+    def get_list(self):
+        """Return the live values list in the correct order; callers must not mutate it."""
+        return self._values
+    
     def reset(self):
         """Reset all values to None."""
-        self._values = [None] * len(self.output_names)
+        # Cleared in place so repeated resets reuse the same list
+        values = self._values
+        for idx in range(len(values)):
+            values[idx] = None
         return self
+    
+    @classmethod
+    def for_feedback(cls):
+        """Create a manager for FEEDBACK_OUTPUTS from the layout precomputed at import."""
+        manager = cls.__new__(cls)
+        manager.output_names = FEEDBACK_OUTPUT_NAMES
+        manager.output_map = FEEDBACK_OUTPUT_MAP  # Shared, only ever read
+        manager._values = list(FEEDBACK_BLANK_VALUES)
+        return manager
 
 # Test output schema
 FEEDBACK_OUTPUTS = [
@@ -48,12 +75,17 @@ FEEDBACK_OUTPUTS = [
     "memory_display"       # 11
 ]
 
+# Feedback layout built once, so per-event managers skip the setup
+FEEDBACK_OUTPUT_NAMES = tuple(sys.intern(name) for name in FEEDBACK_OUTPUTS)
+FEEDBACK_OUTPUT_MAP = {name: idx for idx, name in enumerate(FEEDBACK_OUTPUT_NAMES)}
+FEEDBACK_BLANK_VALUES = (None,) * len(FEEDBACK_OUTPUT_NAMES)
+
 def test_output_manager():
     """Test the output manager functionality."""
     print("Testing GradioOutputManager...")
     
     # Create an output manager for feedback outputs
-    outputs = GradioOutputManager(FEEDBACK_OUTPUTS)
+    outputs = GradioOutputManager.for_feedback()
     
     # Test setting individual values
     outputs.set("recommendations", "test_recommendation")
@@ -7,7 +7,7 @@ import sys
 import os
 sys.path.append(os.path.abspath('.'))
 
-from coachable_course_agent.utils import clean_provider_name
+from coachable_course_agent.utils import clean_provider_names_batch
 from scripts.scrapers.base_scraper import BaseScraper
 
 # Create a test scraper to demonstrate the cleaning
@@ -34,9 +34,11 @@ def test_provider_cleaning():
     ]
     
     print("📝 Test Cases:")
-    for original in test_cases:
-        cleaned = clean_provider_name(original)
-        print(f"   \"{original}\" → \"{cleaned}\"")
+    lines = [
+        f"   \"{original}\" → \"{cleaned}\""
+        for original, cleaned in zip(test_cases, clean_provider_names_batch(test_cases))
+    ]
+    sys.stdout.write("\n".join(lines) + "\n")
     
     print("\n🔧 Data Import Pipeline Integration:")
     